@@ -0,0 +1,9 @@
+import os
+
+wsgi_app = "src:app"
+bind = "0.0.0.0:8000"
+# The books routes still serve per-process in-memory data, so multiple workers
+# would each mutate their own copy; raise WEB_CONCURRENCY only once the
+# endpoints are backed by the database through BookService
+workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+worker_class = "uvicorn.workers.UvicornWorker"
@@ -1,10 +1,15 @@
+from collections import OrderedDict
 from typing import Annotated
 
-from fastapi import FastAPI, HTTPException, Query, Path
+import msgspec
+from fastapi import FastAPI, HTTPException, Query, Path, Response
+from fastapi.responses import ORJSONResponse
 
-from schemas import GenreURLChoices, BandCreate, BandWithID
+from schemas import GenreURLChoices, AlbumOut, BandCreate, BandOut, BandWithID
+from search import Trie
 
 
+# Seed data only; handlers read the model and index structures built below
 bands_data = [
     {"id": 1, "name": "The Kinks", "genre": "Rock"},
     {"id": 2, "name": "FX Twin", "genre": "Electronic"},
@@ -13,42 +18,104 @@ bands_data = [
     {"id": 4, "name": "Run-DMC", "genre": "Hip-Hop"},
 ]
 
-app = FastAPI()
+# Validated once at startup; handlers reuse these instead of rebuilding models per request
+bands_models: list[BandWithID] = [BandWithID(**band) for band in bands_data]
+
+# Index by id so single-band lookups are one hash probe instead of a list scan
+bands_by_id: dict[int, BandWithID] = {band.id: band for band in bands_models}
+
+# Struct-of-arrays filter columns, positionally aligned with bands_models,
+# so get_bands scans flat lists instead of touching model objects per row
+band_ids: list[int] = [band['id'] for band in bands_data]
+band_genres_lower: list[str] = [band['genre'].lower() for band in bands_data]
+
+# Bands bucketed by lowercase genre: the faceted endpoint dispatches in O(1)
+bands_by_genre: dict[str, list[BandWithID]] = {}
+for band_model in bands_models:
+    bands_by_genre.setdefault(
+        band_model.genre.value.lower(), []).append(band_model)
+
+# Substring index over lowercase names, built once instead of re-scanned per request
+band_name_index = Trie()
+for band in bands_data:
+    band_name_index.insert(band['name'], band['id'])
+
+def band_out(band: BandWithID) -> BandOut:
+    return BandOut(
+        id=band.id,
+        name=band.name,
+        genre=band.genre.value,
+        albums=[
+            AlbumOut(title=album.title, release_date=album.release_date)
+            for album in band.albums
+        ],
+    )
+
+
+# msgspec structs for the list responses, aligned with bands_models
+bands_out: list[BandOut] = [band_out(band) for band in bands_models]
+
+# Serialized GET /bands payloads keyed by (genre, q), cleared on every write.
+# Bounded with LRU eviction since q can take arbitrarily many values
+_bands_json_cache: OrderedDict[tuple, bytes] = OrderedDict()
+_BANDS_CACHE_MAX_ENTRIES = 128
+
+app = FastAPI(default_response_class=ORJSONResponse)
 
 
-@app.get('/bands', response_model=list[BandWithID])
+@app.get('/bands')
 async def get_bands(
     genre: GenreURLChoices | None = None,
     q: Annotated[str | None, Query(max_length=10)] = None
-) -> list[BandWithID]:
-    bands_list = [BandWithID(**band) for band in bands_data]
+) -> Response:
+    q_lower = q.lower() if q else None
+    cache_key = (genre, q_lower)
+    payload = _bands_json_cache.get(cache_key)
 
-    if genre:
-        bands_list = [
-            band for band in bands_list if band.genre.value.lower() == genre.value]
+    if payload is None:
+        selected = range(len(bands_models))
 
-    if q:
-        bands_list = [band for band in bands_list if q.lower()
-                      in band.name.lower()]
+        if genre:
+            selected = [
+                i for i in selected if band_genres_lower[i] == genre.value]
 
-    return bands_list
+        if q_lower:
+            matched_ids = band_name_index.search(q_lower)
+            selected = [i for i in selected if band_ids[i] in matched_ids]
+
+        bands_list = [bands_out[i] for i in selected]
+
+        payload = msgspec.json.encode(bands_list)
+        _bands_json_cache[cache_key] = payload
+
+        if len(_bands_json_cache) > _BANDS_CACHE_MAX_ENTRIES:
+            _bands_json_cache.popitem(last=False)
+    else:
+        _bands_json_cache.move_to_end(cache_key)
+
+    return Response(content=payload, media_type='application/json')
 
 
 @app.post('/bands', response_model=BandWithID)
 async def create_band(band_data: BandCreate):
-    generated_id = bands_data[-1]['id'] + 1
+    generated_id = band_ids[-1] + 1
     new_band = BandWithID(id=generated_id, **band_data.model_dump())
-    bands_data.append(new_band.model_dump())
+    bands_by_id[generated_id] = new_band
+    bands_models.append(new_band)
+    bands_out.append(band_out(new_band))
+    band_ids.append(generated_id)
+    band_genres_lower.append(new_band.genre.value.lower())
+    bands_by_genre.setdefault(
+        new_band.genre.value.lower(), []).append(new_band)
+    band_name_index.insert(new_band.name, generated_id)
+    _bands_json_cache.clear()
 
     return new_band
 
 
 @app.get('/bands/{band_id}', response_model=BandWithID, status_code=200)
 async def get_band(band_id: Annotated[int, Path(title='The band ID')]) -> BandWithID:
-    band = next(
-        (BandWithID(**band) for band in bands_data if band['id'] == band_id),
-        None
-    )
+    band = bands_by_id.get(band_id)
 
     if band is None:
         raise HTTPException(status_code=404, detail='Band not found')
@@ -57,5 +124,5 @@ async def get_band(band_id: Annotated[int, Path(title='The band ID')]) -> BandWi
 
 
 @app.get('/bands/genre/{genre}')
-async def get_bands_by_genre(genre: GenreURLChoices) -> list[dict]:
-    return [band for band in bands_data if band['genre'].lower() == genre.value.lower()]
+async def get_bands_by_genre(genre: GenreURLChoices) -> list[BandWithID]:
+    return bands_by_genre.get(genre.value, [])
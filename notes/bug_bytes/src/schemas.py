@@ -1,6 +1,7 @@
 from enum import Enum
 from datetime import date
 
+import msgspec
 from pydantic import BaseModel, field_validator
 
 
@@ -37,3 +38,17 @@ class BandCreate(BandBase):
 
 class BandWithID(BandBase):
     id: int
+
+
+# Serialization-only structs for the read path; msgspec encodes these in C,
+# while the BaseModel classes above keep validating incoming data
+class AlbumOut(msgspec.Struct):
+    title: str
+    release_date: date
+
+
+class BandOut(msgspec.Struct):
+    id: int
+    name: str
+    genre: str
+    albums: list[AlbumOut] = []
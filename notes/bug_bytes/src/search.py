@@ -0,0 +1,23 @@
+class Trie:
+    """In-memory substring index: maps every suffix of the indexed names to the ids containing it."""
+
+    def __init__(self) -> None:
+        self.children: dict[str, 'Trie'] = {}
+        self.ids: set[int] = set()
+
+    def insert(self, name: str, item_id: int) -> None:
+        lowered = name.lower()
+        for start in range(len(lowered)):
+            node = self
+            for char in lowered[start:]:
+                node = node.children.setdefault(char, Trie())
+                node.ids.add(item_id)
+
+    def search(self, query: str) -> set[int]:
+        node = self
+        for char in query.lower():
+            child = node.children.get(char)
+            if child is None:
+                return set()
+            node = child
+        return node.ids
@@ -3,14 +3,20 @@ from typing import get_type_hints, get_origin, get_args, Annotated
 
 
 def check_value_range(func):
+    # Resolve the annotations once at decoration time; the signature never
+    # changes, so there is no reason to re-run get_type_hints per call
+    type_hints = get_type_hints(func, include_extras=True)
+    x_hint = type_hints.get('x')
+
+    bounds = None
+    if get_origin(x_hint) is Annotated:
+        hint_type, *hint_args = get_args(x_hint)
+        bounds = hint_args[0]
+
     @wraps(func)
     def wrapped(x):
-        type_hints = get_type_hints(double, include_extras=True)
-        x_hint = type_hints.get('x')
-
-        if get_origin(x_hint) is Annotated:
-            hint_type, *hint_args = get_args(x_hint)
-            low, high = hint_args[0]
+        if bounds is not None:
+            low, high = bounds
             if not (low <= x <= high):
                 raise ValueError(
                     f"x falls outside of the boundary between {low} and {high}")
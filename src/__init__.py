@@ -1,6 +1,7 @@
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from src.books.routes import book_router
 from src.db.main import init_db
@@ -21,6 +22,7 @@ app = FastAPI(
     description="A book review web service",
     version=version,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 app.include_router(book_router, prefix=f"/api/{version}/books", tags=["books", "api"])
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List
 
 from src.books.schemas import BookCreate
 
@@ -67,3 +67,15 @@ sample_books: List[BookCreate] = [
         language="Italian",
     ),
 ]
+
+# Index by id so single-book lookups are one hash probe instead of a list scan
+books_by_id: Dict[int, BookCreate] = {book.id: book for book in sample_books}
+
+# Position of each book in sample_books, so deletes pop by index instead of
+# rescanning the list with remove()
+book_index: Dict[int, int] = {book.id: i for i, book in enumerate(sample_books)}
+
+# Books bucketed by lowercase language so faceted filters skip the full scan
+books_by_language: Dict[str, List[BookCreate]] = {}
+for book in sample_books:
+    books_by_language.setdefault(book.language.lower(), []).append(book)
@@ -3,24 +3,27 @@ from datetime import datetime
 
 import sqlalchemy.dialects.postgresql as pg
 from sqlmodel import Column, Field, SQLModel
+from uuid6 import uuid7
 
 
 class Book(SQLModel, table=True):
     __tablename__ = "books"  # type: ignore
 
+    # Time-ordered UUIDv7 keys cluster inserts at the tail of the B-tree index
+    # instead of scattering them like uuid4
     uid: uuid.UUID = Field(
-        sa_column=Column(
-            pg.UUID, nullable=False, primary_key=True, default=uuid.uuid4()
-        )
+        sa_column=Column(pg.UUID, nullable=False, primary_key=True, default=uuid7)
     )
-    title: str
-    author: str
+    title: str = Field(index=True)
+    author: str = Field(index=True)
     publisher: str
     published_date: str
     page_count: int
     language: str
-    created_at: datetime = Field(Column(pg.TIMESTAMP, default=datetime.now))
-    updated_at: datetime = Field(Column(pg.TIMESTAMP, default=datetime.now))
+    created_at: datetime = Field(
+        sa_column=Column(pg.TIMESTAMP, default=datetime.now, index=True)
+    )
+    updated_at: datetime = Field(sa_column=Column(pg.TIMESTAMP, default=datetime.now))
 
     def __repr__(self) -> str:
         return f"Book(title='{self.title}')"
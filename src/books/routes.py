@@ -1,59 +1,120 @@
-from typing import List
+from collections import OrderedDict
+from typing import List, Tuple
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Query, Response, status
 from fastapi.exceptions import HTTPException
+from pydantic import TypeAdapter
 
-from src.books.db import sample_books
+from src.books.db import book_index, books_by_id, books_by_language, sample_books
 from src.books.schemas import BookCreate, BookUpdate
 
 book_router = APIRouter()
 
+books_adapter = TypeAdapter(List[BookCreate])
 
-@book_router.get("/", response_model=List[BookCreate])
-async def get_all_books():
-    """Return all books."""
-    return sample_books
+# Serialized payloads for GET /, keyed by (limit, offset), cleared on writes.
+# Bounded with LRU eviction so clients probing arbitrary offsets cannot grow
+# the cache without limit
+_books_json_cache: "OrderedDict[Tuple[int, int], bytes]" = OrderedDict()
+_BOOKS_CACHE_MAX_ENTRIES = 128
+
+
+@book_router.get("/")
+async def get_all_books(
+    limit: int = Query(50, ge=1, le=500), offset: int = Query(0, ge=0)
+) -> Response:
+    """Return a page of books."""
+    payload = _books_json_cache.get((limit, offset))
+
+    if payload is None:
+        payload = books_adapter.dump_json(sample_books[offset : offset + limit])
+        _books_json_cache[(limit, offset)] = payload
+
+        if len(_books_json_cache) > _BOOKS_CACHE_MAX_ENTRIES:
+            _books_json_cache.popitem(last=False)
+    else:
+        _books_json_cache.move_to_end((limit, offset))
+
+    return Response(content=payload, media_type="application/json")
 
 
 @book_router.post("/", response_model=BookCreate, status_code=status.HTTP_201_CREATED)
-async def create_book(book: BookCreate) -> dict:
+async def create_book(book: BookCreate) -> BookCreate:
     """Create a book."""
-    new_book = book.model_dump()
+    if book.id in books_by_id:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail="Book id already exists"
+        )
+
     sample_books.append(book)
-    return new_book
+    books_by_id[book.id] = book
+    book_index[book.id] = len(sample_books) - 1
+    books_by_language.setdefault(book.language.lower(), []).append(book)
+    _books_json_cache.clear()
+    return book
 
 
 @book_router.get("/{book_id}", response_model=BookCreate)
-async def get_book(book_id: int) -> dict:
+async def get_book(book_id: int) -> BookCreate:
     """Get book by id."""
-    for book in sample_books:
-        if book.id == book_id:
-            return book.model_dump()
+    book = books_by_id.get(book_id)
+
+    if book is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Book not found"
+        )
 
-    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Book not found")
+    return book
 
 
 @book_router.patch("/{book_id}", response_model=BookCreate)
-async def update_book(book_id: int, book_data: BookUpdate) -> dict:
+async def update_book(book_id: int, book_data: BookUpdate) -> BookCreate:
     """Update book."""
-    for book in sample_books:
-        if book.id == book_id:
-            book.title = book_data.title
-            book.author = book_data.author
-            book.publisher = book_data.publisher
-            book.page_count = book_data.page_count
-            book.language = book_data.language
+    book = books_by_id.get(book_id)
+
+    if book is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Book not found"
+        )
+
+    if book.language.lower() != book_data.language.lower():
+        books_by_language[book.language.lower()].remove(book)
+        books_by_language.setdefault(book_data.language.lower(), []).append(book)
 
-            return book.model_dump()
+    book.title = book_data.title
+    book.author = book_data.author
+    book.publisher = book_data.publisher
+    book.page_count = book_data.page_count
+    book.language = book_data.language
+    _books_json_cache.clear()
 
-    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Book not found")
+    return book
 
 
 @book_router.delete("/{book_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_book(book_id: int):
     """Delete book."""
-    for book in sample_books:
-        if book.id == book_id:
-            sample_books.remove(book)
-            return
-    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Book not found")
+    position = book_index.pop(book_id, None)
+
+    if position is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Book not found"
+        )
+
+    book = books_by_id.pop(book_id)
+
+    if position < len(sample_books) and sample_books[position] is book:
+        sample_books.pop(position)
+
+        # Books after the removed one shift left by one position
+        for shifted in sample_books[position:]:
+            book_index[shifted.id] -= 1
+    else:
+        # The position drifted out of sync with the list; fall back to
+        # removing by identity and rebuild the positions from scratch
+        sample_books.remove(book)
+        book_index.clear()
+        book_index.update({b.id: i for i, b in enumerate(sample_books)})
+
+    books_by_language[book.language.lower()].remove(book)
+    _books_json_cache.clear()
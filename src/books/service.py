@@ -0,0 +1,25 @@
+from typing import AsyncIterator
+
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.books.models import Book
+
+
+class BookService:
+    """Database-backed book operations."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_all_books(self) -> AsyncIterator[Book]:
+        """Stream all books without materializing the full result set."""
+        statement = (
+            select(Book)
+            .order_by(Book.created_at.desc())
+            .execution_options(yield_per=100)
+        )
+        result = await self.session.stream(statement)
+
+        async for row in result:
+            yield row[0]
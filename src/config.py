@@ -3,6 +3,7 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
     DATABASE_URL: str
+    SQL_ECHO: bool = False
 
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
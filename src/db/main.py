@@ -1,9 +1,16 @@
-from sqlalchemy.ext.asyncio import AsyncEngine
-from sqlmodel import SQLModel, create_engine
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
 
 from src.config import config
 
-engine = AsyncEngine(create_engine(url=config.DATABASE_URL, echo=True))
+engine = create_async_engine(
+    url=config.DATABASE_URL,
+    echo=config.SQL_ECHO,
+    pool_size=20,
+    max_overflow=10,
+    pool_recycle=1800,
+    pool_pre_ping=True,
+)
 
 
 async def init_db():